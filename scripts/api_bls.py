@@ -12,20 +12,28 @@
     Dependencies:
 
         External:
-            - copy
+            - atexit
+            - csv
             - datetime
-            - json
+            - gzip
+            - hashlib
+            - io
             - logging
             - os
+            - random
             - re
+            - threading
             - time
+            - concurrent.futures
             - typing
             - http, 
             - itertools
             - requests
+            - requests.adapters
             - requests.exceptions
+            - orjson
             - SQLAlchemy (create_engine, MetaData, Table, Column, Integer, String, Boolean, Float, ForeignKey,
-              dialects.postgresql.insert, engine.URL)
+              dialects.postgresql.insert, engine.Connection, engine.Engine, engine.URL)
 
         Internal:
             - api_key, config
@@ -36,19 +44,27 @@
         - Provides additional calculations such as net and percent changes, annual averages, and limited series catalog info.
 =========================================================================================="""
 
-import copy
+import atexit
+import csv
 import datetime
-import json
+import gzip
+import hashlib
+import io
 import logging
 import os
+import random
 import re
+import threading
 import time
-from typing import TypedDict, Dict, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypedDict, Dict, List, Tuple
 from http import HTTPStatus
 from itertools import batched
 
+import orjson
 import requests
-from requests.exceptions import HTTPError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, HTTPError, Timeout
 
 from sqlalchemy import (
     create_engine,
@@ -62,7 +78,7 @@ from sqlalchemy import (
     ForeignKey,
 )
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.engine import URL
+from sqlalchemy.engine import Connection, Engine, URL
 
 class DataDict(TypedDict):
     seriesID: str
@@ -94,6 +110,38 @@ class BLSResponse(TypedDict):
 
 logger = logging.getLogger('main.api')
 
+class BlsResponseError(Exception):
+    """
+    Raised when the BLS API answers with HTTP 200 but a status other than "REQUEST_SUCCEEDED".
+    """
+
+metadata = MetaData()
+state_series_table = Table('state_series', metadata,
+                           Column('seriesID', String, primary_key=True),
+                           Column('series', String, nullable=False),
+                           Column('state', String, nullable=False),
+                           Column('survey', String),
+                           Column('is_adjusted', Boolean))
+national_series_table = Table('national_series', metadata,
+                              Column('seriesID', String, primary_key=True),
+                              Column('series', String, nullable=False),
+                              Column('survey', String),
+                              Column('is_adjusted', Boolean))
+state_results_table = Table('state_results', metadata,
+                            Column('seriesID', String, ForeignKey('state_series.seriesID'), primary_key=True),
+                            Column('year', Integer, nullable=False, primary_key=True),
+                            Column('period', String, nullable=False, primary_key=True),
+                            Column('period_name',String, nullable=False),
+                            Column('value', Float),
+                            Column('footnotes', String))
+national_results_table = Table('national_results', metadata,
+                               Column('seriesID', String, ForeignKey('national_series.seriesID'), primary_key=True),
+                               Column('year', Integer, nullable=False, primary_key=True),
+                               Column('period', String, nullable=False, primary_key=True),
+                               Column('period_name',String, nullable=False),
+                               Column('value', Float),
+                               Column('footnotes', String))
+
 class BlsApiCall:
     """
     Manages the ETL process for retrieving data from the BLS API and loading it into a PostgreSQL database.
@@ -104,13 +152,39 @@ class BlsApiCall:
         national_series (list[dict], optional): List of dictionaries representing national series IDs.
         state_series (list[dict], optional): List of dictionaries representing state series IDs.
         series_count (int or str, optional): Maximum number of series IDs to process. Defaults to all provided.
+        use_cache (bool, optional): Reuse responses stored in cache_dir instead of querying the API. Defaults to True.
 
     Raises:
         Exception: If both or neither of national_series/state_series are provided.
     """
     query_count_file = "outputs/runtime_output/query_count.txt"
-
-    def __init__(self, start_year: int, end_year: int, national_series: list[dict]= [], state_series: list[dict] = [], series_count: int|str = ""):
+    cache_dir = "outputs/runtime_output/cache"
+    CACHE_TTL = 24 * 60 * 60
+    URL_ENDPOINT = "https://api.bls.gov/publicAPI/v2/timeseries/data/"
+    HEADERS = {"Content-Type": "application/json"}
+    RETRIES = 3
+    MAX_BACKOFF = 30
+    BACKOFF_JITTER = 0.5
+    YEAR_LIMIT = 20
+    SERIES_LIMIT = 50
+    QUERY_LIMIT = 500
+    QUERY_FLUSH_INTERVAL = 10
+    MAX_WORKERS = 4
+    LOAD_BATCH_SIZE = 1000
+    REQUEST_INTERVAL = 0.25
+    TIMEOUT = (5, 30)
+    _inflight: Dict[Tuple[str, bool, bool], Future] = {}
+    _inflight_lock = threading.Lock()
+    _engine: Engine | None = None
+    _engine_lock = threading.Lock()
+    NO_DATA_PATTERN = re.compile(r'No Data Available for Series (\w+) Year: (\d\d\d\d)')
+    NO_SERIES_PATTERN = re.compile(r'Series does not exist for Series (\w+)')
+    RETRY_CODES: frozenset[int] = frozenset({HTTPStatus.INTERNAL_SERVER_ERROR.value,
+                                             HTTPStatus.BAD_GATEWAY.value,
+                                             HTTPStatus.SERVICE_UNAVAILABLE.value,
+                                             HTTPStatus.GATEWAY_TIMEOUT.value})
+
+    def __init__(self, start_year: int, end_year: int, national_series: list[dict]= [], state_series: list[dict] = [], series_count: int|str = "", use_cache: bool = True):
 
 
         if len(state_series) != 0 and len(national_series) != 0:
@@ -124,6 +198,8 @@ class BlsApiCall:
         self.end_year = end_year
         self.national_series = national_series
         self.state_series = state_series
+        self.use_cache = use_cache
+        self._api_key = os.getenv("BLS_API_KEY")
 
         if len(self.state_series) == 0:
             self.series_count = int(series_count) if series_count != '' else len(national_series)
@@ -134,183 +210,439 @@ class BlsApiCall:
             self.national = False
             self.state = True
 
-    def _read_query(self) -> None:
+        self._query_lock = threading.Lock()
+        self._load_query_count()
+        atexit.register(self.close)
+        self._rate_lock = threading.Lock()
+        self._next_request_time = 0.0
+
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=self.MAX_WORKERS))
+
+    def __enter__(self) -> "BlsApiCall":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
         """
-        Reads the query count file to obtain the first and last query counts and their corresponding days.
+        Persists the query count and closes the pooled HTTP session.
 
         Special Note:
-            If only one entry exists in the file, initializes last_query_count and last_query_day to the first values.
+            Registered with atexit, so it also runs when the instance is not used as a context manager.
+            Closing drops that exit hook, so a closed instance is not kept alive or flushed again at exit.
+            Calling it more than once is safe.
         """
+        atexit.unregister(self.close)
+        self._flush_query_count()
+        self._session.close()
 
-        if os.path.exists(self.query_count_file):
-
-            with open(self.query_count_file, "r") as file:
+    def _read_query_count(self) -> Tuple[int, str] | None:
+        """
+        Reads the stored daily query count from the query count file.
 
-                first_query_count, first_query_day = file.readline().split(',')
-                self.first_query_count = int(first_query_count)
-                self.first_query_day = int(first_query_day)
-       
-                try:
-                    for line in file:
-                        last_line = line
-                    last_query_count, last_query_day = tuple(last_line.split(","))
-                    self.last_query_count = int(last_query_count)
-                    self.last_query_day = int(last_query_day)
+        Returns:
+            Tuple[int, str] | None: The stored count and its ISO date, or None if the file is missing or empty.
+        """
+        if not os.path.exists(self.query_count_file):
+            return None
+        with open(self.query_count_file, "r") as file:
+            line = file.readline()
+        if not line:
+            return None
+        stored_count, stored_day = line.split(",")
+        return int(stored_count), stored_day.strip()
+
+    def _load_query_count(self) -> None:
+        """
+        Loads the stored daily query count into memory.
 
-                except UnboundLocalError:
-                    self.last_query_count = int(first_query_count)
-                    self.last_query_day = int(first_query_day)
+        Special Note:
+            The file holds one "count, date" line with an ISO date. A missing or empty file, or a file
+            written before the date format was used, starts the count at zero for today.
+        """
+        self._query_count, self._query_day = self._read_query_count() or (0, datetime.date.today().isoformat())
+        self._unflushed_count = 0
 
-    def _create_query_file(self) -> None:
+    def _write_query_count(self) -> None:
         """
-        Creates the query count file if it does not exist, or deletes it if the day has changed.
+        Merges the queries reserved since the last write into the query count file.
+
+        The file is read again and only this instance's unflushed queries are added to the stored count,
+        so increments written by other instances or processes in the meantime are kept. The result is
+        written to a temporary file that replaces the old one. Callers must hold _query_lock.
         """
-        self._read_query()
+        today = datetime.date.today().isoformat()
+        if self._query_day != today:
+            self._query_count, self._query_day, self._unflushed_count = 0, today, 0
 
-        self.current_query_day = int(datetime.datetime.strftime(datetime.datetime.now(), "%d"))
-        self.just_created = False 
-        
-        if os.path.exists(self.query_count_file) and self.current_query_day - self.first_query_day > 0:
-            os.remove(self.query_count_file)    
+        stored = self._read_query_count()
+        stored_count = stored[0] if stored and stored[1] == today else 0
+        total = stored_count + self._unflushed_count
 
-        if not os.path.exists(self.query_count_file):
-            self.first_query_day= int(datetime.datetime.strftime(datetime.datetime.now(), "%d"))
-            self.count = 1
+        os.makedirs(os.path.dirname(self.query_count_file), exist_ok=True)
+        temp_file = f"{self.query_count_file}.tmp"
+        with open(temp_file, "w") as file:
+            file.write(f"{total}, {today}\n")
+        os.replace(temp_file, self.query_count_file)
 
-            with open(self.query_count_file, "w") as file:
-                entry = f"{self.count}, {self.first_query_day}\n"
-                file.write(str(entry))
-            self.just_created = True
-    
-    def _increment_query_count(self) -> None:
+        self._query_count, self._unflushed_count = total, 0
+
+    def _flush_query_count(self) -> None:
+        """
+        Merges this instance's reserved queries into the query count file.
+
+        Runs every QUERY_FLUSH_INTERVAL reservations, at the end of extract, on close, and at interpreter
+        exit for instances that were never closed.
         """
-        Increments the query count by 1 each time an API request is made.
+        with self._query_lock:
+            self._write_query_count()
+
+    def _quota_gate(self) -> int:
+        """
+        Reserves one query against the daily limit using the in-memory query count.
+
+        The count starts over when the calendar date changes. Every QUERY_FLUSH_INTERVAL reservations
+        are merged into the query count file, so a crash mid-extract loses at most that many.
+        Callers running in worker threads must hold _query_lock.
+
+        Returns:
+            int: The number of this query within the current day.
 
         Raises:
             Exception: If the daily query limit (500 queries) is exceeded.
         """
-        self._read_query()
-        self.current_query_day = int(datetime.datetime.strftime(datetime.datetime.now(), "%d"))
-        if os.path.exists(self.query_count_file) and \
-                    self.last_query_count >= 500 and \
-                    self.current_query_day - self.first_query_day == 0:
+        today = datetime.date.today().isoformat()
+        if self._query_day != today:
+            self._query_count, self._query_day, self._unflushed_count = 0, today, 0
+
+        if self._query_count >= self.QUERY_LIMIT:
             logger.critical('Queries may not exceed 500 within a day.')
             raise Exception("Queries may not exceed 500 within a day.")
-        
-        if not self.just_created:
-            with open(self.query_count_file, "a") as file:
-                file.write(f"{self.last_query_count + 1}, {self.current_query_day}\n")
 
-    def bls_request(self, series: list, start_year: str, end_year: str) -> BLSResponse:
+        self._query_count += 1
+        self._unflushed_count += 1
+        query_number = self._query_count
+        if self._unflushed_count >= self.QUERY_FLUSH_INTERVAL:
+            self._write_query_count()
+        return query_number
+
+    def _query_key(self, series: list, start_year: int, end_year: int) -> str:
+        """
+        Builds a key that identifies a query by a hash of its sorted series IDs and year range.
+
+        Parameters:
+            series (list): List of series IDs in the query.
+            start_year (int): Start year of the query.
+            end_year (int): End year of the query.
+
+        Returns:
+            str: Hex digest identifying the query.
+        """
+        return hashlib.sha256(orjson.dumps({"s": sorted(series), "sy": start_year, "ey": end_year})).hexdigest()
+
+    def _inflight_key(self, series: list, start_year: int, end_year: int) -> Tuple[str, bool, bool]:
+        """
+        Builds the key that identifies an in-flight request across instances.
+
+        Two requests only share a result when they ask for the same query, both read or both skip
+        the cache, and both are for the same kind of series (national or state).
+
+        Parameters:
+            series (list): List of series IDs in the query.
+            start_year (int): Start year of the query.
+            end_year (int): End year of the query.
+
+        Returns:
+            Tuple[str, bool, bool]: The query key, use_cache, and whether the series are national.
+        """
+        return self._query_key(series, start_year, end_year), self.use_cache, self.national
+
+    def _cache_path(self, series_id: str, start_year: int, end_year: int) -> str:
+        """
+        Builds the cache file path for one series over a year range.
+
+        Parameters:
+            series_id (str): The series ID.
+            start_year (int): Start year of the query.
+            end_year (int): End year of the query.
+
+        Returns:
+            str: Path of the gzipped JSON cache file for the series.
+        """
+        return os.path.join(self.cache_dir, f"{self._query_key([series_id], start_year, end_year)}.json.gz")
+
+    def _read_cache(self, series_ids: list, start_year: int, end_year: int) -> Dict[str, Series]:
+        """
+        Reads the cached data for each series ID that has a valid cache entry.
+
+        Special Note:
+            Queries ending before the current year cover closed years and never expire. Queries that
+            reach the current year expire after CACHE_TTL seconds, since BLS may still revise them.
+
+        Parameters:
+            series_ids (list): List of series IDs to look up.
+            start_year (int): Start year of the query.
+            end_year (int): End year of the query.
+
+        Returns:
+            Dict[str, Series]: Cached series keyed by series ID. Series without a valid entry are left out.
+        """
+        expires = end_year >= datetime.date.today().year
+        cached: Dict[str, Series] = {}
+
+        for series_id in series_ids:
+            path = self._cache_path(series_id, start_year, end_year)
+            if not os.path.exists(path):
+                continue
+            if expires and time.time() - os.path.getmtime(path) > self.CACHE_TTL:
+                continue
+            with gzip.open(path, "rb") as file:
+                cached[series_id] = orjson.loads(file.read())
+
+        return cached
+
+    def _write_cache(self, series_lst: List[Series], start_year: int, end_year: int) -> None:
+        """
+        Writes each series from an API response to its own cache file.
+
+        Each file is written to a temporary path and moved into place, so readers never see a partial file.
+
+        Parameters:
+            series_lst (List[Series]): The series returned by the API.
+            start_year (int): Start year of the query.
+            end_year (int): End year of the query.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for series in series_lst:
+            path = self._cache_path(series["seriesID"], start_year, end_year)
+            temp_file = f"{path}.{threading.get_ident()}.tmp"
+            with gzip.open(temp_file, "wb") as file:
+                file.write(orjson.dumps(series))
+            os.replace(temp_file, path)
+
+    def _cached_response(self, series_lst: List[Series]) -> BLSResponse:
+        """
+        Wraps cached series in the shape of an API response so transform can treat them alike.
+
+        Parameters:
+            series_lst (List[Series]): Series read from the cache.
+
+        Returns:
+            BLSResponse: A successful response containing the cached series.
+        """
+        return {"status": "REQUEST_SUCCEEDED", "responseTime": 0, "message": [], "Results": {"series": series_lst}}
+
+    def _wait_for_rate_limit(self) -> None:
+        """
+        Spaces request starts at least REQUEST_INTERVAL seconds apart across all worker threads.
+
+        Each caller reserves the next free start time under a lock and sleeps outside it,
+        so a request only waits when another one started less than REQUEST_INTERVAL ago.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            start_time = max(now, self._next_request_time)
+            self._next_request_time = start_time + self.REQUEST_INTERVAL
+        if start_time > now:
+            time.sleep(start_time - now)
+
+    def _backoff(self, attempt: int) -> None:
+        """
+        Sleeps before the next retry using capped exponential backoff with jitter.
+
+        The delay is min(MAX_BACKOFF, 2**attempt) seconds scaled by a random factor in
+        [1 - BACKOFF_JITTER, 1 + BACKOFF_JITTER], so concurrent workers do not retry in lockstep.
+        No sleep happens after the final attempt.
+
+        Parameters:
+            attempt (int): The attempt number that just failed, starting at 1.
+        """
+        if attempt >= self.RETRIES:
+            return
+        delay = min(self.MAX_BACKOFF, 2**attempt)
+        time.sleep(delay * (1 + random.uniform(-self.BACKOFF_JITTER, self.BACKOFF_JITTER)))
+
+    def bls_request(self, series: list, start_year: int, end_year: int, check_cache: bool = True) -> BLSResponse:
         """
         Sends a POST request to the BLS API for the specified series and date range.
 
+        When use_cache is set and every series has a valid cache entry, the cached data is returned
+        without contacting the API, and the series in successful responses are written to the cache. If the same query
+        is already in flight, the caller waits for that request and shares its result.
+
         Parameters:
             series (list): List of series IDs to query.
-            start_year (str): Desired start year.
-            end_year (str): Desired end year.
+            start_year (int): Desired start year.
+            end_year (int): Desired end year.
+            check_cache (bool, optional): Look for the series in the cache before querying. extract passes
+                False because it has already split cached series out of its batches. Defaults to True.
 
         Returns:
             BLSResponse: The JSON response from the API.
 
         Raises:
             ValueError: If more than 50 series IDs are provided or if the year range exceeds 20.
-            HTTPError: If an HTTP error occurs (with retries for specific status codes).
-            Exception: If the API response status is not "REQUEST_SUCCEEDED".
-        """
-        URL_ENDPOINT = "https://api.bls.gov/publicAPI/v2/timeseries/data/"
-        RETRIES = 3
-        YEAR_LIMIT = 20
-        SERIES_LIMIT = 50
-        RETRY_CODES: list = [HTTPStatus.INTERNAL_SERVER_ERROR, HTTPStatus.BAD_GATEWAY, HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.GATEWAY_TIMEOUT]
-        year_range = int(end_year) - int(start_year)
-        headers = {"Content-Type": "application/json"}
-        payload = json.dumps({"seriesid": series, 
-                              "startyear": start_year, 
-                              "endyear": end_year, 
-                              "registrationKey": os.getenv("BLS_API_KEY")})
-        
-        if len(series) > SERIES_LIMIT:
+            HTTPError: If the API answers with a non-retryable HTTP status.
+            Exception: If every attempt fails with a retryable HTTP status, connection error, or timeout.
+            BlsResponseError: If the API response status is not "REQUEST_SUCCEEDED".
+        """
+        year_range = end_year - start_year
+        if len(series) > self.SERIES_LIMIT:
             raise ValueError("Can only take up to 50 seriesID's per query.")
-        elif year_range > YEAR_LIMIT:
+        elif year_range > self.YEAR_LIMIT:
             raise ValueError("Can only take in up to 20 years per query.")
-       
-        for attempt in range(1, RETRIES + 1):
-            self._create_query_file()
-            self._increment_query_count()
+
+        key = self._inflight_key(series, start_year, end_year)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_owner:
+            logger.debug('Waiting on in-flight request: %s SeriesIDs, from %s to %s', len(series), start_year, end_year)
+            return future.result()
+
+        try:
+            response_json = self._send_request(series, start_year, end_year, check_cache)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response_json)
+            return response_json
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _send_request(self, series: list, start_year: int, end_year: int, check_cache: bool = True) -> BLSResponse:
+        """
+        Returns a cached response or sends the query to the BLS API with retries.
+
+        Parameters:
+            series (list): List of series IDs to query.
+            start_year (int): Desired start year.
+            end_year (int): Desired end year.
+            check_cache (bool, optional): Look for the series in the cache before querying. Defaults to True.
+
+        Returns:
+            BLSResponse: The JSON response from the cache or the API.
+        """
+        if self.use_cache and check_cache:
+            cached = self._read_cache(series, start_year, end_year)
+            if len(cached) == len(set(series)):
+                logger.debug('Cache hit: %s SeriesIDs, from %s to %s', len(series), start_year, end_year)
+                return self._cached_response(list(cached.values()))
+
+        payload = orjson.dumps({"seriesid": series,
+                              "startyear": str(start_year),
+                              "endyear": str(end_year),
+                              "registrationKey": self._api_key})
+
+        for attempt in range(1, self.RETRIES + 1):
+            self._wait_for_rate_limit()
+            with self._query_lock:
+                query_number = self._quota_gate()
 
             try:
-                response = requests.post(URL_ENDPOINT, data=payload, headers=headers)
-                
-                if self.national:
-                    logger.info('Request #%s: %s National SeriesIDs, from %s to %s', self.last_query_count, len(series), start_year, end_year)
-                if self.state:
-                    logger.info('Request #%s: %s State SeriesIDs, from %s to %s', self.last_query_count, len(series), start_year, end_year)
-                
-                if response.status_code != HTTPStatus.OK.value:
-                    raise HTTPError(response=response.status_code)
-                elif response.status_code == HTTPStatus.OK.value:
-                    response_json = response.json()
-                    response_status = response_json["status"]
-                
-                    if response_status != "REQUEST_SUCCEEDED":
-                        logger.warning('Request #%s: Status Code: %s Response: %s', self.last_query_count, response.status_code, response_status)
-                        raise Exception
-                    else:
-                        logger.info('Request #%s: Status Code: %s Response: %s', self.last_query_count, response.status_code, response_status)
-                        return response_json
-
-            except HTTPError as e:
-                if e.response in RETRY_CODES:
-                    final_error = e.response
-                    logger.warning('HTTP Error: %s Attempt: %s', e.response, attempt)
-                    time.sleep(2**attempt)
+                response = self._session.post(self.URL_ENDPOINT, data=payload, headers=self.HEADERS, timeout=self.TIMEOUT)
+            except (RequestsConnectionError, Timeout) as e:
+                final_error = cause = e
+                logger.warning('Connection Error: %s Attempt: %s', e, attempt)
+                self._backoff(attempt)
+                continue
+
+            if self.national:
+                logger.info('Request #%s: %s National SeriesIDs, from %s to %s', query_number, len(series), start_year, end_year)
+            if self.state:
+                logger.info('Request #%s: %s State SeriesIDs, from %s to %s', query_number, len(series), start_year, end_year)
+
+            if response.status_code != HTTPStatus.OK.value:
+                http_error = HTTPError(f"HTTP Error: {response.status_code}", response=response)
+                if response.status_code in self.RETRY_CODES:
+                    final_error, cause = response.status_code, http_error
+                    logger.warning('HTTP Error: %s Attempt: %s', response.status_code, attempt)
+                    self._backoff(attempt)
                     continue
-                else:
-                    final_error = e.response
-                    logger.critical('HTTP Error: %s', e.response)
-                    raise HTTPError(f"HTTP Error: {e.response}")
-                
-            except Exception as e:
+                logger.critical('HTTP Error: %s', response.status_code)
+                raise http_error
+
+            logger.debug('Request #%s: Content-Encoding: %s', query_number, response.headers.get("Content-Encoding"))
+            response_json = orjson.loads(response.content)
+            response_status = response_json["status"]
+
+            if response_status != "REQUEST_SUCCEEDED":
+                logger.warning('Request #%s: Status Code: %s Response: %s', query_number, response.status_code, response_status)
                 logger.critical('Response Status from API is not "REQUEST_SUCCEEDED"')
-                raise Exception('Response Status from API is not "REQUEST_SUCCEEDED"')
+                raise BlsResponseError('Response Status from API is not "REQUEST_SUCCEEDED"')
+
+            logger.info('Request #%s: Status Code: %s Response: %s', query_number, response.status_code, response_status)
+            if self.use_cache:
+                self._write_cache(response_json["Results"]["series"], start_year, end_year)
+            return response_json
 
         logger.critical('API Error: %s', final_error)
-        raise Exception(f"API Error: {final_error}")
+        raise Exception(f"API Error: {final_error}") from cause
 
     def extract(self) -> None:
         """
         Extracts data from the BLS API in batches of up to 50 series IDs.
 
-        The method iterates over the list of series IDs in batches, sends API requests via
-        bls_request, and stores the JSON responses.
+        The method drops duplicate series IDs and, when use_cache is set, reads cached series first so
+        only uncached IDs are batched. It sends up to MAX_WORKERS API requests via bls_request
+        concurrently and stores the JSON responses in batch order, after any cached response.
         """
-        BATCH_SIZE = 50
+        BATCH_SIZE = self.SERIES_LIMIT
         INPUT_AMOUNT: int = self.series_count
-        start_year = str(self.start_year)
-        end_year = str(self.end_year)
+        start_year = int(self.start_year)
+        end_year = int(self.end_year)
         self.lst_of_queries: list[BLSResponse] = []
 
         if self.national:
-            series_id_lst = [i.get("seriesID") for i in self.national_series][:INPUT_AMOUNT]
+            all_series_ids = [i.get("seriesID") for i in self.national_series]
         elif self.state:
-            series_id_lst = [i.get("seriesID") for i in self.state_series][:INPUT_AMOUNT]
-
-        batch_progress = 0
-        for batch_tuple in batched(series_id_lst, BATCH_SIZE):
-            batch = list(batch_tuple)
-            batch_size = len(batch)
-            batch_progress += batch_size
-            total_size = len(series_id_lst)
-
-            logger.debug(f"Extracting batch of size: {batch_progress}")
-            logger.debug(f'Progress: {batch_progress}/{total_size} {(batch_progress/total_size):.0%}')
-
-            result = self.bls_request(batch, start_year, end_year)
-            self.lst_of_queries.append(result)
-            time.sleep(0.25)
-            
-        logger.info(f"Successfully extracted {total_size} IDs")
+            all_series_ids = [i.get("seriesID") for i in self.state_series]
+
+        unique_series_ids = list(dict.fromkeys(all_series_ids))
+        duplicate_count = len(all_series_ids) - len(unique_series_ids)
+        if duplicate_count:
+            logger.warning('Skipping %s duplicate seriesIDs', duplicate_count)
+        series_id_lst = unique_series_ids[:INPUT_AMOUNT]
+        total_size = len(series_id_lst)
+
+        if self.use_cache:
+            cached = self._read_cache(series_id_lst, start_year, end_year)
+            if cached:
+                logger.debug('Cache hit: %s of %s SeriesIDs', len(cached), total_size)
+                self.lst_of_queries.append(self._cached_response(list(cached.values())))
+                series_id_lst = [series_id for series_id in series_id_lst if series_id not in cached]
+
+        batches = [list(batch_tuple) for batch_tuple in batched(series_id_lst, BATCH_SIZE)]
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                futures = [executor.submit(self.bls_request, batch, start_year, end_year, check_cache=False) for batch in batches]
+                try:
+                    batch_progress = total_size - len(series_id_lst)
+                    for batch, future in zip(batches, futures):
+                        result = future.result()
+                        batch_progress += len(batch)
+
+                        logger.debug("Extracting batch of size: %s", batch_progress)
+                        logger.debug('Progress: %s/%s %.0f%%', batch_progress, total_size, 100 * batch_progress / total_size)
+
+                        self.lst_of_queries.append(result)
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            self._flush_query_count()
+
+        logger.info("Successfully extracted %s IDs", total_size)
         
     def _log_message(self, messages: list[str]) -> None:
         """
@@ -320,8 +652,8 @@ class BlsApiCall:
             messages (list[str]): List of messages from the API response.
         """
         for message in messages:
-            year_reg_match = re.fullmatch(r'No Data Available for Series (\w+) Year: (\d\d\d\d)', message)
-            no_series_reg_match = re.fullmatch(r'Series does not exist for Series (\w+)', message)
+            year_reg_match = self.NO_DATA_PATTERN.fullmatch(message)
+            no_series_reg_match = self.NO_SERIES_PATTERN.fullmatch(message)
             if year_reg_match:
                 series_id, year = year_reg_match.group(1,2)
                 msg = 'No Data Available'
@@ -349,24 +681,16 @@ class BlsApiCall:
         """
         adjusted = ', seasonally adjusted'
         not_adjusted = ', not seasonally adjusted'
-        
-        def remove_terms(str):
-            text_lower = str.lower()
-            index1 = text_lower.find(adjusted)
-            index2 = text_lower.find(not_adjusted)
-            if index1 != -1:
-                str = str[:index1]
-            elif index2 != -1:
-                str = str[:index2]
-            return str
-    
+
         for dct in lst:
-            if dct['series'].lower().endswith(adjusted):
+            series = dct['series']
+            series_lower = series.lower()
+            if series_lower.endswith(adjusted):
                 dct['is_adjusted'] = True
-                dct['series'] = remove_terms(dct['series'])
-            elif dct['series'].lower().endswith(not_adjusted):
+                dct['series'] = series[:series_lower.find(adjusted)]
+            elif series_lower.endswith(not_adjusted):
                 dct['is_adjusted'] = False
-                dct['series'] = remove_terms(dct['series'])
+                dct['series'] = series[:series_lower.find(not_adjusted)]
             else:
                 dct['is_adjusted'] = None
 
@@ -382,6 +706,7 @@ class BlsApiCall:
             - Removing duplicates.
             - Processing series metadata to flag seasonal adjustments.
         """
+        EMPTY_FOOTNOTES = [{}]
         self.final_dct_lst: list[DataDict] = []
 
         for response in self.lst_of_queries:
@@ -395,96 +720,127 @@ class BlsApiCall:
             for series in series_lst:
                 series_id: str = series["seriesID"]
 
-                for data_point in series["data"]:
-                    data_dict: DataDict = {
+                self.final_dct_lst.extend(
+                    {
                         "seriesID": series_id,
                         "year": int(data_point["year"]),
                         "period": data_point["period"],
                         "period_name": data_point["periodName"],
                         "value": float(data_point["value"]) if data_point["value"] != '-' else None,
-                        "footnotes": str(data_point["footnotes"]) if data_point["footnotes"] != str([{}]) else None
+                        "footnotes": str(data_point["footnotes"]) if data_point["footnotes"] != EMPTY_FOOTNOTES else None
                     }
-                    self.final_dct_lst.append(data_dict)
+                    for data_point in series["data"])
+
+        if self.national:
+            national_series_copy = [dict(dct) for dct in self.national_series]
+            self.national_series_copy = self._convert_adjusted(national_series_copy)
+        elif self.state:
+            state_series_copy = [dict(dct) for dct in self.state_series]
+            self.state_series_copy = self._convert_adjusted(state_series_copy)
+
+    @classmethod
+    def _get_engine(cls) -> Engine:
+        """
+        Returns the shared database engine, creating it on first use.
+
+        Reads database configuration from environmental variables and creates the series and
+        results tables if they don't exist. Later calls reuse the engine and skip the DDL check.
+
+        Special Note:
+            executemany_mode is a psycopg2 option, so it is only passed when DRIVER selects psycopg2.
+            Other PostgreSQL drivers use SQLAlchemy's default insertmanyvalues batching.
+
+        Returns:
+            Engine: The SQLAlchemy engine for the configured PostgreSQL database.
+        """
+        with cls._engine_lock:
+            if cls._engine is None:
+                driver = os.getenv("DRIVER")
+                username = os.getenv("USERNAME")
+                password = os.getenv("PASSWORD")
+                host = os.getenv("HOST")
+                database = os.getenv("DATABASE")
+                port = os.getenv("PORT")
+
+                url_object = URL.create(drivername=driver, username=username, password=password, host=host, database=database, port=port)
+                engine_options = {"insertmanyvalues_page_size": cls.LOAD_BATCH_SIZE}
+                if url_object.get_dialect().driver == "psycopg2":
+                    engine_options["executemany_mode"] = "values_plus_batch"
+                engine = create_engine(url_object, **engine_options)
+                metadata.create_all(bind=engine, checkfirst=True)
+                cls._engine = engine
+            return cls._engine
 
-        try:
-            if self.national:
-                national_series_copy = copy.deepcopy(self.national_series)
-                self.national_series_copy = self._convert_adjusted(national_series_copy)
-            elif self.state:
-                state_series_copy = copy.deepcopy(self.state_series)
-                self.state_series_copy = self._convert_adjusted(state_series_copy)
-        except copy.Error as e:
-            logging.error(f"Error copying series lists: {e}")
-            raise
-        
     def load(self) -> None:
         """
         Loads the transformed data into the PostgreSQL database using SQLAlchemy.
         
-        Reads database configuration from environmental variables, creates tables for series
-        and results if they don't exist, and performs upsert operations to avoid duplicates.
-        """
-
-        driver = os.getenv("DRIVER")
-        username = os.getenv("USERNAME")
-        password = os.getenv("PASSWORD")
-        host = os.getenv("HOST")
-        database = os.getenv("DATABASE")
-        port = os.getenv("PORT")
-
-        url_object = URL.create(drivername=driver, username=username, password=password, host=host, database=database, port=port)
-        engine = create_engine(url_object, logging_name='SQLAlchemy')
-        metadata = MetaData()
-        state_series = Table('state_series', 
-                            metadata, 
-                            Column('seriesID', String, primary_key=True),
-                            Column('series', String, nullable=False),
-                            Column('state', String, nullable=False),
-                            Column('survey', String),
-                            Column('is_adjusted', Boolean))
-        national_series = Table('national_series', 
-                            metadata, 
-                            Column('seriesID', String, primary_key=True),
-                            Column('series', String, nullable=False),
-                            Column('survey', String),
-                            Column('is_adjusted', Boolean))
-        state_results = Table('state_results', 
-                            metadata, 
-                            Column('seriesID', String, ForeignKey('state_series.seriesID'), primary_key=True),
-                            Column('year', Integer, nullable=False, primary_key=True),
-                            Column('period', String, nullable=False, primary_key=True),
-                            Column('period_name',String, nullable=False),
-                            Column('value', Float),
-                            Column('footnotes', String))
-        national_results = Table('national_results', 
-                            metadata, 
-                            Column('seriesID', String, ForeignKey('national_series.seriesID'), primary_key=True),
-                            Column('year', Integer, nullable=False, primary_key=True),
-                            Column('period', String, nullable=False, primary_key=True),
-                            Column('period_name',String, nullable=False),
-                            Column('value', Float),
-                            Column('footnotes', String))
+        Uses the shared engine from _get_engine and performs upsert operations to avoid duplicates.
+        Series rows are sent in executemany chunks of LOAD_BATCH_SIZE and results rows are
+        bulk loaded with COPY, all within a single transaction.
 
-        metadata.create_all(bind=engine, checkfirst=True)
+        Special Note:
+            COPY goes through psycopg2's copy_expert. With any other driver the results rows are
+            sent in executemany chunks of LOAD_BATCH_SIZE, like the series rows.
+        """
+
+        engine = self._get_engine()
 
         if self.state:
-            series_stmt = insert(state_series).values(self.state_series_copy).on_conflict_do_nothing()
-            results_stmt = insert(state_results).values(self.final_dct_lst).on_conflict_do_nothing()
+            series_stmt = insert(state_series_table).on_conflict_do_nothing()
+            results_table = state_results_table
+            series_rows = self.state_series_copy
         if self.national:
-            series_stmt = insert(national_series).values(self.national_series_copy).on_conflict_do_nothing()
-            results_stmt = insert(national_results).values(self.final_dct_lst).on_conflict_do_nothing()
-        with engine.connect() as connect:
-            connect.execute(series_stmt)
-            connect.execute(results_stmt)
-            connect.commit()
+            series_stmt = insert(national_series_table).on_conflict_do_nothing()
+            results_table = national_results_table
+            series_rows = self.national_series_copy
+        with engine.begin() as connect:
+            for chunk in batched(series_rows, self.LOAD_BATCH_SIZE):
+                connect.execute(series_stmt, list(chunk))
+            if connect.dialect.driver == "psycopg2":
+                self._copy_results(connect, results_table)
+            else:
+                results_stmt = insert(results_table).on_conflict_do_nothing()
+                for chunk in batched(self.final_dct_lst, self.LOAD_BATCH_SIZE):
+                    connect.execute(results_stmt, list(chunk))
+
+    def _copy_results(self, connect: Connection, table: Table) -> None:
+        """
+        Bulk loads the transformed results into a results table with PostgreSQL COPY.
+
+        The rows are streamed as CSV into a temporary table shaped like the target, then inserted
+        into the target with ON CONFLICT DO NOTHING so existing rows are left untouched. None is
+        written as \\N and declared as the NULL marker, so empty strings load as empty strings.
+
+        Special Note:
+            The temporary table is dropped on commit, so this must run inside a transaction.
+
+        Parameters:
+            connect (Connection): Open SQLAlchemy connection with an active transaction.
+            table (Table): The results table to load.
+        """
+        columns = [column.name for column in table.columns]
+        column_lst = ", ".join(f'"{column}"' for column in columns)
+        temp_table = f"tmp_{table.name}"
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows([r"\N" if row[column] is None else row[column] for column in columns] for row in self.final_dct_lst)
+        buffer.seek(0)
+
+        cursor = connect.connection.cursor()
+        try:
+            cursor.execute(f'CREATE TEMP TABLE {temp_table} (LIKE "{table.name}" INCLUDING DEFAULTS) ON COMMIT DROP')
+            cursor.copy_expert(f"COPY {temp_table} ({column_lst}) FROM STDIN WITH (FORMAT CSV, NULL '\\N')", buffer)
+            cursor.execute(f'INSERT INTO "{table.name}" ({column_lst}) SELECT {column_lst} FROM {temp_table} ON CONFLICT DO NOTHING')
+        finally:
+            cursor.close()
 
 if __name__ == "__main__":
 
     from main import read_file
 
-    state_series_path = os.path.join(os.getcwd(), 'inputs/state_series_dimension.csv')
-    state_series = read_file(state_series_path)
-    national_series_path = os.path.join(os.getcwd(), 'inputs/national_series_dimension.csv')
+    national_series_path = os.path.join(os.getcwd(), 'inputs/national_series.csv')
     national_series = read_file(national_series_path)
     call_engine = BlsApiCall(2000, 2005,national_series=national_series, series_count=1)
     call_engine.extract()
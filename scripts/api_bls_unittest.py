@@ -9,12 +9,14 @@
     Dependencies:
 
         External:
+        - concurrent.futures
         - unittest
         - unittest.mock
         - http.HTTPStatus
-        - json
+        - orjson
         - os
         - requests.exceptions
+        - tempfile
 
         Internal:
         - api_bls
@@ -22,19 +24,31 @@
 
     Special Concerns: 
         - Tests require a mock BLS API environment
-        - Some tests modify the query_count_file and need to clean up afterward
+        - Each test points query_count_file and cache_dir at its own scratch directory,
+          so tests do not share state on disk and can run in parallel
         - All API calls are mocked to avoid hitting real API endpoints
 =========================================================================================="""
 
-import json
 import os
+import tempfile
 import unittest
+from concurrent.futures import Future
 from http import HTTPStatus
 from unittest.mock import Mock, patch
 
-from requests.exceptions import HTTPError
+import orjson
+from requests.exceptions import ConnectionError as RequestsConnectionError, HTTPError
 
-from api_bls import BlsApiCall
+from api_bls import BlsApiCall, BlsResponseError, state_results_table
+
+def _mock_response(status_code: HTTPStatus, payload: dict | None = None) -> Mock:
+    """
+    Builds a mocked requests.Response with the given status code and JSON body.
+    """
+    response = Mock(spec=["status_code", "content", "headers"])
+    response.status_code = status_code
+    response.content = orjson.dumps(payload)
+    return response
 
 class TestBlsApi(unittest.TestCase):
     """
@@ -44,15 +58,14 @@ class TestBlsApi(unittest.TestCase):
     rate limiting, and data transformation functionality.
     """
 
-    query_count_file = "outputs/runtime_output/query_count.txt"
-
     @classmethod
     def setUpClass(cls):
         """
-        Set up test fixtures before each test method runs.
+        Set up fixtures shared by every test in the class.
         
-        Creates sample state and national series DataFrames and initializes
-        a BlsApiCall instance for testing.
+        Creates sample state and national series inputs and a single BlsApiCall instance.
+        The instance is built inside a class-wide scratch directory, so its exit flush
+        never touches the real outputs folder.
         """
         cls.state_series = [{'seriesID': '123ABC', 
                             'series': 'Always be Cool', 
@@ -76,20 +89,55 @@ class TestBlsApi(unittest.TestCase):
                                 'is_adjusted': 'False'}]
         
         cls.national_series_input = [i["seriesID"] for i in cls.national_series]
-        cls.api_call = BlsApiCall(2000, 2005, state_series=cls.state_series)
+
+        cls.expected_headers = {"Content-Type": "application/json"}
+        cls.expected_payload = {
+            "seriesid": cls.state_series_input,
+            "startyear": "2005",
+            "endyear": "2007",
+            "registrationKey": os.getenv("BLS_API_KEY"),
+        }
+
+        cls.class_scratch_dir = tempfile.TemporaryDirectory()
+        cls.class_patchers = [patch.object(BlsApiCall, "query_count_file", os.path.join(cls.class_scratch_dir.name, "query_count.txt")),
+                              patch.object(BlsApiCall, "cache_dir", os.path.join(cls.class_scratch_dir.name, "cache"))]
+        for patcher in cls.class_patchers:
+            patcher.start()
+        cls.api_call = BlsApiCall(2000, 2005, state_series=cls.state_series, use_cache=False)
 
         return super().setUpClass()
 
     @classmethod
-    def tearDownClass(self):
+    def tearDownClass(cls):
         """
-        Currently does nothing.
+        Closes the shared instance inside the class scratch directory, then removes it.
         """
-        pass
-        return super().tearDown()
+        cls.api_call.close()
+        for patcher in reversed(cls.class_patchers):
+            patcher.stop()
+        cls.class_scratch_dir.cleanup()
+        return super().tearDownClass()
     
+    def setUp(self):
+        """
+        Gives each test a scratch directory for the query count file and cache, and resets
+        the shared instance's query count and rate limiter.
+        """
+        scratch_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch_dir.cleanup)
+        self.query_count_file = os.path.join(scratch_dir.name, "query_count.txt")
+
+        for attribute, value in (("query_count_file", self.query_count_file),
+                                 ("cache_dir", os.path.join(scratch_dir.name, "cache"))):
+            patcher = patch.object(BlsApiCall, attribute, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.api_call._load_query_count()
+        self.api_call._next_request_time = 0.0
+
     @patch('api_bls.logger.info')
-    @patch('api_bls.requests.post')
+    @patch('api_bls.requests.Session.post')
     def test_bls_request(self, mocked_post, mocked_log):
         """
         Test successful API request functionality.
@@ -100,30 +148,35 @@ class TestBlsApi(unittest.TestCase):
         - Successful response is handled correctly
         - Logging occurs as expected
         """
-        if os.path.exists(self.query_count_file):
-            os.remove(self.query_count_file)
-
-        mock_response = Mock()
-        mock_response.status_code = HTTPStatus.OK
-        mock_response.json.return_value = {"status": "REQUEST_SUCCEEDED"}
-        mocked_post.return_value = mock_response
-        headers = {"Content-Type": "application/json"}
-        payload = json.dumps(
-            {
-                "seriesid": self.state_series_input,
-                "startyear": 2005,
-                "endyear": 2007,
-                "registrationKey": os.getenv("BLS_API_KEY"),
-            }
-        )
+        mocked_post.return_value = _mock_response(HTTPStatus.OK, {"status": "REQUEST_SUCCEEDED"})
         result = self.api_call.bls_request(self.state_series_input, 2005, 2007)
 
-        mocked_post.assert_called_once_with('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=payload,  headers=headers)
+        mocked_post.assert_called_once()
+        self.assertEqual(mocked_post.call_args.args, ('https://api.bls.gov/publicAPI/v2/timeseries/data/',))
+        self.assertEqual(orjson.loads(mocked_post.call_args.kwargs['data']), self.expected_payload)
+        self.assertEqual(mocked_post.call_args.kwargs['headers'], self.expected_headers)
+        self.assertEqual(mocked_post.call_args.kwargs['timeout'], (5, 30))
         self.assertEqual(result, {"status": "REQUEST_SUCCEEDED"})
-        assert mocked_log.call_count == 2
+        self.assertEqual(mocked_log.call_count, 2)
+
+    @patch('api_bls.requests.Session.send')
+    def test_request_headers(self, mocked_send):
+        """
+        Test the headers on the request the pooled session actually sends.
+
+        Verifies that the JSON content type is set and that the session's own
+        Accept-Encoding negotiates compressed responses.
+        """
+        mocked_send.return_value = _mock_response(HTTPStatus.OK, {"status": "REQUEST_SUCCEEDED"})
+
+        self.api_call.bls_request(self.state_series_input, 2005, 2007)
+
+        prepared = mocked_send.call_args.args[0]
+        self.assertEqual(prepared.headers["Content-Type"], "application/json")
+        self.assertIn("gzip", prepared.headers["Accept-Encoding"])
 
     @patch('api_bls.logger.critical')
-    @patch('api_bls.requests.post')
+    @patch('api_bls.requests.Session.post')
     def test_bls_request_limit(self, mocked_post, mocked_log):
         """
         Test API request limit enforcement.
@@ -131,27 +184,18 @@ class TestBlsApi(unittest.TestCase):
         Verifies an exception is raised when exceeding the 500 daily request limit.
         Confirms logging and that no actual API call is made when limit is reached.
         """
-        if os.path.exists(self.query_count_file):
-                os.remove(self.query_count_file)
-
-        mock_response = Mock()
-        mock_response.status_code = HTTPStatus.OK
-        mock_response.json.return_value = {"status": "REQUEST_SUCCEEDED"}
-        mocked_post.return_value = mock_response
+        mocked_post.return_value = _mock_response(HTTPStatus.OK, {"status": "REQUEST_SUCCEEDED"})
         
-        for _ in range(1, 501):
-            self.api_call._create_query_file()
-            self.api_call._increment_query_count()
+        self.api_call._query_count = self.api_call.QUERY_LIMIT
         
         with self.assertRaises(Exception) as e:
             self.api_call.bls_request(self.state_series_input, 2005, 2007)
 
         mocked_log.assert_called_once()
         mocked_post.assert_not_called()
-        assert mocked_post.call_count <= 500
         self.assertEqual(str(e.exception), "Queries may not exceed 500 within a day.")
 
-    @patch('api_bls.requests.post')
+    @patch('api_bls.requests.Session.post')
     def test_bls_year_limit(self, mocked_post):
         """
         Test year range limit enforcement.
@@ -159,15 +203,12 @@ class TestBlsApi(unittest.TestCase):
         Verifies that requests spanning more than 20 years are rejected
         with an appropriate ValueError exception.
         """
-        if os.path.exists(self.query_count_file):
-                os.remove(self.query_count_file)
-        
         with self.assertRaises(ValueError) as e:
             self.api_call.bls_request(self.state_series_input, 2000, 2025)
-            mocked_post.assert_not_called()
+        mocked_post.assert_not_called()
         self.assertEqual(str(e.exception), "Can only take in up to 20 years per query.")
        
-    @patch('api_bls.requests.post')
+    @patch('api_bls.requests.Session.post')
     def test_bls_id_limit(self, mocked_post):
         """
         Test series ID limit enforcement.
@@ -175,19 +216,16 @@ class TestBlsApi(unittest.TestCase):
         Verifies that requests containing more than 50 series IDs are rejected
         with an appropriate ValueError exception.
         """
-        if os.path.exists(self.query_count_file):
-                os.remove(self.query_count_file)
-        
         mock_lst = [i for i in range(60)]
 
         with self.assertRaises(ValueError) as e:
             self.api_call.bls_request(mock_lst, 2000, 2005)
-            mocked_post.assert_not_called()
+        mocked_post.assert_not_called()
         self.assertEqual(str(e.exception), "Can only take up to 50 seriesID's per query.")
 
     @patch('api_bls.logger.info')
     @patch('api_bls.logger.critical')
-    @patch('api_bls.requests.post')
+    @patch('api_bls.requests.Session.post')
     def test_bls_bad_request(self, mocked_post, mocked_critical, mocked_info):
         """
         Test handling of bad HTTP responses.
@@ -195,9 +233,7 @@ class TestBlsApi(unittest.TestCase):
         Verifies that non-200 HTTP responses result in appropriate exceptions
         and that proper logging occurs.
         """
-        mock_response = Mock()
-        mock_response.status_code = HTTPStatus.BAD_REQUEST
-        mocked_post.return_value = mock_response
+        mocked_post.return_value = _mock_response(HTTPStatus.BAD_REQUEST)
 
         with self.assertRaises(HTTPError) as e:
             self.api_call.bls_request(self.state_series_input, 2000, 2005)
@@ -205,74 +241,126 @@ class TestBlsApi(unittest.TestCase):
         mocked_post.assert_called_once()
         mocked_info.assert_called_once()
         self.assertEqual(str(e.exception), f"HTTP Error: {mocked_post().status_code}")
+        self.assertIs(e.exception.response, mocked_post.return_value)
 
+    @patch('api_bls.random.uniform', return_value=0)
+    @patch('api_bls.time.sleep')
     @patch('api_bls.logger.critical')
     @patch('api_bls.logger.warning')
-    @patch('api_bls.requests.post')
-    def test_http_error_retry(self, mocked_post, mocked_warning, mocked_critical):
+    @patch('api_bls.requests.Session.post')
+    def test_http_error_retry(self, mocked_post, mocked_warning, mocked_critical, mocked_sleep, mocked_jitter):
         """
         Test retry mechanism for server errors.
         
         Verifies that server errors (5xx) trigger the retry mechanism
         and that the appropriate number of retries occur before failing.
         """    
-        mock_response = Mock()
-        mock_response.status_code = HTTPStatus.INTERNAL_SERVER_ERROR
-        mocked_post.return_value = mock_response
+        mocked_post.return_value = _mock_response(HTTPStatus.INTERNAL_SERVER_ERROR)
 
         with self.assertRaises(Exception) as e1:
-            with self.assertRaises(HTTPError):
-                self.api_call.bls_request(self.state_series_input, 2000, 2002)
-        
+            self.api_call.bls_request(self.state_series_input, 2000, 2002)
+
         self.assertEqual(str(e1.exception), f'API Error: {HTTPStatus.INTERNAL_SERVER_ERROR.value}')
-        assert mocked_critical.call_count == 1
-        assert mocked_warning.call_count == 3
-        assert mocked_post.call_count == 3
-     
+        self.assertIsInstance(e1.exception.__cause__, HTTPError)
+        mocked_critical.assert_called_once()
+        self.assertEqual(mocked_warning.call_count, 3)
+        self.assertEqual(mocked_post.call_count, 3)
+        mocked_sleep.assert_any_call(2)
+        mocked_sleep.assert_any_call(4)
+
+    @patch('api_bls.random.uniform', return_value=0)
+    @patch('api_bls.time.sleep')
+    @patch('api_bls.logger.critical')
+    @patch('api_bls.logger.warning')
+    @patch('api_bls.requests.Session.post')
+    def test_connection_error_retry(self, mocked_post, mocked_warning, mocked_critical, mocked_sleep, mocked_jitter):
+        """
+        Test retry mechanism for connection failures.
+
+        Verifies that connection errors are retried with a backoff between
+        attempts but not after the final one.
+        """
+        mocked_post.side_effect = RequestsConnectionError("Connection refused")
+
+        with self.assertRaises(Exception) as e:
+            self.api_call.bls_request(self.state_series_input, 2000, 2002)
+
+        self.assertEqual(str(e.exception), 'API Error: Connection refused')
+        mocked_critical.assert_called_once()
+        self.assertEqual(mocked_warning.call_count, 3)
+        self.assertEqual(mocked_post.call_count, 3)
+        mocked_sleep.assert_any_call(2)
+        mocked_sleep.assert_any_call(4)
+        self.assertNotIn(((8,),), mocked_sleep.call_args_list)
+
     @patch('api_bls.logger.info')
-    @patch('api_bls.datetime.datetime')
-    @patch('api_bls.requests.post')
+    @patch('api_bls.datetime.date')
+    @patch('api_bls.requests.Session.post')
     def test_bls_reset(self, mocked_post, mocked_date, mocked_log):
         """
         Test query counter reset on date change.
         
-        Verifies that the query counter resets when the date changes,
-        ensuring that the daily limit is properly managed.
+        Verifies that the query counter resets when the date changes, including
+        when only the month differs, ensuring that the daily limit is properly managed.
         """
-        if os.path.exists(self.query_count_file):
-                os.remove(self.query_count_file)
+        mocked_post.return_value = _mock_response(HTTPStatus.OK, {"status": "REQUEST_SUCCEEDED"})
 
-        mock_response = Mock()
-        mock_response.status_code = HTTPStatus.OK
-        mock_response.json.return_value = {"status": "REQUEST_SUCCEEDED"}
-        mocked_post.return_value = mock_response
+        self.api_call._query_count, self.api_call._query_day = 5, "2025-02-03"
+        mocked_date.today.return_value.isoformat.return_value = "2025-03-03"
 
-        mocked_date.strftime.return_value = '02'
+        self.api_call.bls_request(self.state_series_input, 2000, 2005)
+        self.api_call._flush_query_count()
 
-        for _ in range(5):
-            self.api_call.bls_request(self.state_series_input, 2000, 2005)
+        with open(self.query_count_file,'r') as file:
+            count, day = file.readline().split(',')
+            self.assertEqual(file.readline(), '')
 
-        mocked_date.strftime.return_value = '03'
+        self.assertEqual(int(count), 1)
+        self.assertEqual(day.strip(), "2025-03-03")
+        mocked_post.assert_called_once()
+        self.assertEqual(mocked_log.call_count, 2)
 
-        self.api_call.bls_request(self.state_series_input, 2000, 2005)
+    def test_query_count_merge(self):
+        """
+        Test merging query counts from several instances.
+
+        Verifies that each flush adds only the queries that instance reserved since
+        its last flush, so an older instance flushing last cannot undercount the day.
+        """
+        other_call = BlsApiCall(2000, 2005, state_series=self.state_series, use_cache=False)
+        self.addCleanup(other_call.close)
+
+        for _ in range(3):
+            self.api_call._quota_gate()
+        for _ in range(2):
+            other_call._quota_gate()
 
-        with open('outputs/runtime_output/query_count.txt','r') as file:
-            lines = []
-            for line in file:
-                lines.append(line)
+        other_call._flush_query_count()
+        self.api_call._flush_query_count()
+        self.api_call._flush_query_count()
 
-            count, day = lines[0].split(',')
-            count = int(count)
-            day = int(day)
+        with open(self.query_count_file) as file:
+            self.assertEqual(int(file.readline().split(",")[0]), 5)
+        self.assertEqual(self.api_call._query_count, 5)
 
-        assert len(lines) == 1
-        assert count == 1
-        assert day == 3
-        assert mocked_post.call_count == 6
-        assert mocked_log.call_count == 12
+    def test_query_count_periodic_flush(self):
+        """
+        Test the periodic flush of reserved queries.
+
+        Verifies that every QUERY_FLUSH_INTERVAL reservations reach the query count
+        file without waiting for extract to finish or the instance to close.
+        """
+        for _ in range(self.api_call.QUERY_FLUSH_INTERVAL - 1):
+            self.api_call._quota_gate()
+        self.assertFalse(os.path.exists(self.query_count_file))
+
+        self.api_call._quota_gate()
+
+        with open(self.query_count_file) as file:
+            self.assertEqual(int(file.readline().split(",")[0]), self.api_call.QUERY_FLUSH_INTERVAL)
 
     @patch('api_bls.BlsApiCall._log_message')
-    @patch('api_bls.requests.post')
+    @patch('api_bls.requests.Session.post')
     def test_bls_log_function(self, mocked_post, mocked_log_function):  
         """
         Test handling of API message logging.
@@ -280,42 +368,252 @@ class TestBlsApi(unittest.TestCase):
         Verifies that messages in the API response (like missing data warnings)
         are properly logged by the _log_message method.
         """              
-        mock_response = Mock()
-        mock_response.status_code = HTTPStatus.OK
-        mock_response.json.return_value = {'status': 'REQUEST_SUCCEEDED', 
-                                           'responseTime': 225, 
-                                           'message': ['No Data Available for Series 123456 Year: 1972'], 
-                                           'Results': {
-                                                    'series': [
-                                                    {'seriesID': 'SMS01000000000000001', 
-                                                     'data': []}]}}
-        mocked_post.return_value = mock_response
+        mocked_post.return_value = _mock_response(HTTPStatus.OK, {'status': 'REQUEST_SUCCEEDED',
+                                                                  'responseTime': 225,
+                                                                  'message': ['No Data Available for Series 123456 Year: 1972'],
+                                                                  'Results': {
+                                                                        'series': [
+                                                                        {'seriesID': 'SMS01000000000000001',
+                                                                         'data': []}]}})
 
         self.api_call.extract()
         self.api_call.transform()
         mocked_log_function.assert_called_once()
 
+    @patch('api_bls.time.sleep')
     @patch('api_bls.logger.critical')
     @patch('api_bls.logger.warning')
-    def test_response_error(self, mocked_warning, mocked_critical):
+    @patch('api_bls.requests.Session.post')
+    def test_response_error(self, mocked_post, mocked_warning, mocked_critical, mocked_sleep):
         """
         Test handling of non-success API responses.
         
-        Verifies proper exception raising and logging when the API returns
-        a response with a status other than "REQUEST_SUCCEEDED".
+        Verifies that a response with a status other than "REQUEST_SUCCEEDED" raises
+        BlsResponseError without a retry, and that it is logged.
         """
-        config = {'side_effect': Exception()}
-        patcher = patch('api_bls.requests.post', **config)
-        mocked_requests = patcher.start()
+        mocked_post.return_value = _mock_response(HTTPStatus.OK, {"status": "REQUEST_NOT_PROCESSED"})
 
-        with self.assertRaises(Exception) as e1:
+        with self.assertRaises(BlsResponseError) as e1:
             self.api_call.bls_request(self.state_series_input, 2000, 2002)
         self.assertEqual(str(e1.exception), 'Response Status from API is not "REQUEST_SUCCEEDED"')
-        assert mocked_warning.call_count == 0
-        assert mocked_critical.call_count == 1
-        assert mocked_requests.call_count == 1
-        patcher.stop()
-         
+        mocked_warning.assert_called_once()
+        mocked_critical.assert_called_once()
+        mocked_post.assert_called_once()
+        mocked_sleep.assert_not_called()
+
+    @patch('api_bls.requests.Session.post')
+    def test_malformed_response(self, mocked_post):
+        """
+        Test that unexpected failures keep their own exception type.
+
+        Verifies that a body that is not JSON surfaces as a decode error instead of
+        being reported as a non-success API status.
+        """
+        response = _mock_response(HTTPStatus.OK)
+        response.content = b"<html>Service Unavailable</html>"
+        mocked_post.return_value = response
+
+        with self.assertRaises(orjson.JSONDecodeError):
+            self.api_call.bls_request(self.state_series_input, 2000, 2002)
+
+    @patch('api_bls.logger.warning')
+    @patch('api_bls.BlsApiCall.bls_request')
+    def test_extract_duplicate_ids(self, mocked_request, mocked_warning):
+        """
+        Test deduplication of series IDs before batching.
+
+        Verifies that a seriesID listed more than once in the input is only
+        requested once and that the skipped duplicates are logged.
+        """
+        api_call = BlsApiCall(2000, 2005, state_series=self.state_series + self.state_series[:1], use_cache=False)
+        self.addCleanup(api_call.close)
+        mocked_request.return_value = {"status": "REQUEST_SUCCEEDED"}
+
+        api_call.extract()
+
+        mocked_request.assert_called_once_with(self.state_series_input, 2000, 2005, check_cache=False)
+        mocked_warning.assert_called_once()
+
+    @patch('api_bls.requests.Session.post')
+    def test_bls_request_cache(self, mocked_post):
+        """
+        Test per-series response caching for closed year ranges.
+
+        Verifies that a repeated query, or a query for a subset of the same series,
+        is served from the on-disk cache without a second API call.
+        """
+        series_lst = [{"seriesID": series_id, "data": []} for series_id in self.state_series_input]
+        mocked_post.return_value = _mock_response(HTTPStatus.OK, {"status": "REQUEST_SUCCEEDED", "Results": {"series": series_lst}})
+
+        api_call = BlsApiCall(2000, 2005, state_series=self.state_series)
+        self.addCleanup(api_call.close)
+
+        first = api_call.bls_request(self.state_series_input, 2000, 2005)
+        second = api_call.bls_request(list(reversed(self.state_series_input)), 2000, 2005)
+        subset = api_call.bls_request(self.state_series_input[:1], 2000, 2005)
+
+        mocked_post.assert_called_once()
+        sort_key = lambda series: series["seriesID"]
+        self.assertEqual(sorted(first["Results"]["series"], key=sort_key), sorted(second["Results"]["series"], key=sort_key))
+        self.assertEqual(subset["Results"]["series"], series_lst[:1])
+
+    @patch('api_bls.requests.Session.post')
+    def test_extract_cache_split(self, mocked_post):
+        """
+        Test splitting cached series out of extract's batches.
+
+        Verifies that only uncached series are sent to the API and that the
+        cache is read once per extract rather than again for each batch.
+        """
+        cached_series, fresh_series = [{"seriesID": series_id, "data": []} for series_id in self.state_series_input]
+        mocked_post.return_value = _mock_response(HTTPStatus.OK, {"status": "REQUEST_SUCCEEDED", "Results": {"series": [fresh_series]}})
+
+        api_call = BlsApiCall(2000, 2005, state_series=self.state_series)
+        self.addCleanup(api_call.close)
+        api_call._write_cache([cached_series], 2000, 2005)
+
+        with patch.object(api_call, '_read_cache', wraps=api_call._read_cache) as mocked_read:
+            api_call.extract()
+
+        mocked_read.assert_called_once()
+        self.assertEqual(orjson.loads(mocked_post.call_args.kwargs['data'])["seriesid"], [fresh_series["seriesID"]])
+        self.assertEqual([response["Results"]["series"] for response in api_call.lst_of_queries], [[cached_series], [fresh_series]])
+
+    @patch('api_bls.BlsApiCall._send_request')
+    def test_bls_request_inflight(self, mocked_send):
+        """
+        Test coalescing of identical in-flight requests.
+
+        Verifies that a query matching one already in flight returns that
+        request's result instead of sending a second request, and that an
+        instance with a different use_cache setting sends its own request.
+        """
+        key = self.api_call._inflight_key(self.state_series_input, 2000, 2005)
+        in_flight = Future()
+        in_flight.set_result({"status": "REQUEST_SUCCEEDED"})
+        BlsApiCall._inflight[key] = in_flight
+        mocked_send.return_value = {"status": "SENT"}
+        cached_call = BlsApiCall(2000, 2005, state_series=self.state_series)
+        self.addCleanup(cached_call.close)
+
+        try:
+            result = self.api_call.bls_request(list(reversed(self.state_series_input)), 2000, 2005)
+            cached_result = cached_call.bls_request(self.state_series_input, 2000, 2005)
+        finally:
+            BlsApiCall._inflight.pop(key, None)
+
+        mocked_send.assert_called_once()
+        self.assertEqual(result, {"status": "REQUEST_SUCCEEDED"})
+        self.assertEqual(cached_result, {"status": "SENT"})
+
+    @patch('api_bls.requests.Session.close')
+    def test_close(self, mocked_close):
+        """
+        Test context manager support.
+
+        Verifies that leaving the with block persists the query count and
+        closes the pooled HTTP session.
+        """
+        with BlsApiCall(2000, 2005, state_series=self.state_series, use_cache=False) as api_call:
+            api_call._quota_gate()
+
+        mocked_close.assert_called_once()
+        with open(self.query_count_file) as file:
+            self.assertEqual(file.read().split(",")[0].strip(), "1")
+
+    def test_copy_results(self):
+        """
+        Test the COPY based results load.
+
+        Verifies that results rows are streamed as CSV into a temporary table
+        and merged into the target table with ON CONFLICT DO NOTHING, and that
+        None and empty strings stay distinct.
+        """
+        self.api_call.final_dct_lst = [{"seriesID": "A1", "year": 2000, "period": "M01",
+                                        "period_name": "", "value": None, "footnotes": None}]
+        connect = Mock()
+        cursor = connect.connection.cursor.return_value
+
+        self.api_call._copy_results(connect, state_results_table)
+
+        copy_sql, buffer = cursor.copy_expert.call_args.args
+        self.assertIn("COPY tmp_state_results", copy_sql)
+        self.assertIn("NULL '\\N'", copy_sql)
+        self.assertEqual(buffer.getvalue(), "A1,2000,M01,,\\N,\\N\r\n")
+        self.assertIn("ON CONFLICT DO NOTHING", cursor.execute.call_args.args[0])
+        cursor.close.assert_called_once()
+
+    @patch('api_bls.metadata.create_all')
+    @patch('api_bls.create_engine')
+    def test_engine_options(self, mocked_create, mocked_create_all):
+        """
+        Test driver-specific engine options.
+
+        Verifies that the psycopg2-only executemany_mode is passed for psycopg2
+        and left out for other PostgreSQL drivers.
+        """
+        for driver, expected in (("postgresql", True), ("postgresql+psycopg2", True), ("postgresql+psycopg", False)):
+            with self.subTest(driver=driver), patch.object(BlsApiCall, '_engine', None), \
+                    patch.dict(os.environ, {"DRIVER": driver}):
+                BlsApiCall._get_engine()
+                self.assertEqual("executemany_mode" in mocked_create.call_args.kwargs, expected)
+                self.assertEqual(mocked_create.call_args.kwargs["insertmanyvalues_page_size"], BlsApiCall.LOAD_BATCH_SIZE)
+
+    @patch('api_bls.BlsApiCall._copy_results')
+    @patch('api_bls.BlsApiCall._get_engine')
+    def test_load_driver_fallback(self, mocked_engine, mocked_copy):
+        """
+        Test the results load path for each driver.
+
+        Verifies that psycopg2 loads results with COPY and that other drivers
+        send them as batched inserts in the same transaction.
+        """
+        self.api_call.state_series_copy = [{"seriesID": "A1", "series": "Series", "state": "MI",
+                                            "survey": "ABC", "is_adjusted": None}]
+        self.api_call.final_dct_lst = [{"seriesID": "A1", "year": 2000, "period": "M01",
+                                        "period_name": "January", "value": None, "footnotes": None}]
+        connect = mocked_engine.return_value.begin.return_value.__enter__.return_value
+
+        for driver, copies in (("psycopg2", True), ("psycopg", False)):
+            with self.subTest(driver=driver):
+                connect.reset_mock()
+                mocked_copy.reset_mock()
+                connect.dialect.driver = driver
+
+                self.api_call.load()
+
+                self.assertEqual(mocked_copy.called, copies)
+                self.assertEqual(connect.execute.call_count, 1 if copies else 2)
+
+    def test_transform_footnotes(self):
+        """
+        Test flattening of API data points.
+
+        Verifies that empty footnotes are stored as None, non-empty footnotes
+        are kept as strings, and missing values ('-') become None.
+        """
+        api_call = BlsApiCall(2000, 2005, state_series=self.state_series)
+        self.addCleanup(api_call.close)
+        api_call.lst_of_queries = [{'status': 'REQUEST_SUCCEEDED',
+                                    'responseTime': 225,
+                                    'message': [],
+                                    'Results': {
+                                        'series': [
+                                        {'seriesID': '123ABC',
+                                         'data': [
+                                            {'year': '2005', 'period': 'M12', 'periodName': 'December',
+                                             'value': '2022.5', 'footnotes': [{}]},
+                                            {'year': '2005', 'period': 'M11', 'periodName': 'November',
+                                             'value': '-', 'footnotes': [{'code': 'P', 'text': 'preliminary'}]}]}]}}]
+
+        api_call.transform()
+
+        self.assertEqual(api_call.final_dct_lst,
+                         [{'seriesID': '123ABC', 'year': 2005, 'period': 'M12', 'period_name': 'December',
+                           'value': 2022.5, 'footnotes': None},
+                          {'seriesID': '123ABC', 'year': 2005, 'period': 'M11', 'period_name': 'November',
+                           'value': None, 'footnotes': str([{'code': 'P', 'text': 'preliminary'}])}])
+
     def test_init_none(self):
         """
         Test class initialization with no series data.
@@ -324,8 +622,8 @@ class TestBlsApi(unittest.TestCase):
         nor national_series is provided to the constructor.
         """
         with self.assertRaises(Exception) as e:
-            BlsApiCall()
-            self.assertEqual(str(e.exception), 'Argument must only be one series list')
+            BlsApiCall(2000, 2005)
+        self.assertEqual(str(e.exception), 'Argument must only be one series list')
 
     def test_init_both(self):
         """
@@ -336,7 +634,7 @@ class TestBlsApi(unittest.TestCase):
         """
         with self.assertRaises(Exception) as e:
             BlsApiCall(self.state_series, self.national_series)
-            self.assertEqual(str(e.exception), 'Argument must only be one series list')
+        self.assertEqual(str(e.exception), 'Argument must only be one series list')
     
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -13,12 +13,17 @@
 
         External:
             - argparse
+            - atexit
             - csv
             - datetime
             - logging
+            - logging.handlers
             - os
+            - queue
+            - socket
             - subprocess
             - sys
+            - time
             - typing
         Internal:
             - api_bls (BlsApiCall class)
@@ -26,34 +31,34 @@
     Special Notes:
         - Supports both command-line argument parsing and interactive user input.
         - Implements robust error handling and logging for production-level reliability.
+        - api_bls is imported inside main() so --ping, --traceroute and argument errors
+          return without loading requests and SQLAlchemy.
 =========================================================================================="""
 import argparse as ap
+import atexit
 import csv
 import datetime as dt
 import logging
 import os
+import queue
+import socket
 import subprocess
 import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Tuple
 
-from api_bls import BlsApiCall
+BLS_HOST = "api.bls.gov"
+TRACEROUTE_TIMEOUT = 60
+THIS_YEAR = dt.datetime.now().year
+LOG_FORMATTER = logging.Formatter('%(levelname)s - %(asctime)s - %(message)s')
 
-def arg_parser():
+def build_parser() -> ap.ArgumentParser:
     """
-    Parse command-line arguments for the BLS API ETL Pipeline.
-    
+    Build the command-line argument parser for the BLS API ETL Pipeline.
+
     Returns:
-        argparse.Namespace: Parsed command-line arguments including:
-            - path: CSV file path with series IDs.
-            - series_type: 1 for National Series or 2 for State Series.
-            - start_year: The beginning year for data extraction.
-            - end_year: The ending year for data extraction.
-            - series_count: Optional limit on the number of series IDs to process.
-            - ping: Number of pings to test connectivity to the BLS API.
-            - traceroute: Flag to perform a traceroute to the BLS API.
-            - verbose: Flag to enable detailed logging output.
-            - output: Flag to generate CSV output.
-            - silence: Flag to disable logging entirely.
+        argparse.ArgumentParser: Parser for the options documented in arg_parser.
     """
     parser = ap.ArgumentParser(
         prog = 'Bureau of Labor Statistics API Pipeline',
@@ -67,13 +72,36 @@ def arg_parser():
     parser.add_argument('--start-year', type=int, help="Enter start year for query.", default=False,metavar="year")
     parser.add_argument('--end-year', type=int, help="Enter end year for query.", default=False,metavar="year")
     parser.add_argument('-n', '--series-count', type=int, help="Enter number of seriesIDs to input", default=None, metavar="# of series")
-    parser.add_argument('-p','--ping', type=int, help="Enter number of pings to send to the BLS API. Will exit program after execution.", default=False, metavar="# of pings")
+    parser.add_argument('-p','--ping', type=int, help="Enter number of TCP connection probes to send to the BLS API. Will exit program after execution.", default=False, metavar="# of pings")
     parser.add_argument('-t', '--traceroute', help="Check routing to the BLS API. Will exit program after execution.", action='store_true', default=False)
     parser.add_argument('-v','--verbose', help="Include more information to logging output (Set level to debug).", action='store_true', default=False)
     parser.add_argument('-o','--output', help="Flag to generate CSV output of results", action='store_true', default=False)
     parser.add_argument('-s','--silence', help="Turn off logging to console and file. Takes precedent over --output.", action='store_true', default=False)
+    parser.add_argument('-c','--no-cache', help="Query the BLS API even when a cached response is available.", action='store_true', default=False)
+
+    return parser
 
-    return parser.parse_args()
+PARSER = build_parser()
+
+def arg_parser():
+    """
+    Parse command-line arguments for the BLS API ETL Pipeline.
+    
+    Returns:
+        argparse.Namespace: Parsed command-line arguments including:
+            - path: CSV file path with series IDs.
+            - series_type: 1 for National Series or 2 for State Series.
+            - start_year: The beginning year for data extraction.
+            - end_year: The ending year for data extraction.
+            - series_count: Optional limit on the number of series IDs to process.
+            - ping: Number of TCP connection probes to send to the BLS API.
+            - traceroute: Flag to perform a traceroute to the BLS API.
+            - verbose: Flag to enable detailed logging output.
+            - output: Flag to generate CSV output.
+            - silence: Flag to disable logging entirely.
+            - no_cache: Flag to bypass the cached API responses.
+    """
+    return PARSER.parse_args()
 
 def interactive_user_input() -> dict:
     """
@@ -130,7 +158,7 @@ def interactive_user_input() -> dict:
 
 def validate_path(path: str) -> Tuple[bool, str | None]:
     """
-    Check if the provided file path exists.
+    Check if the provided path exists and is a regular file.
     
     Args:
         path (str): The file path to check.
@@ -139,10 +167,10 @@ def validate_path(path: str) -> Tuple[bool, str | None]:
         Tuple[bool, str | None]: A tuple containing a boolean indicating validity,
         and an error message if invalid.
     """
-    if os.path.exists(path):
+    if os.path.isfile(path):
         return True, None
     else:
-        return False, "Path not found."
+        return False, "Path not found or not a file."
     
 def validate_years(start_year: int, end_year: int) -> Tuple[bool, str|None]:
     """
@@ -161,7 +189,7 @@ def validate_years(start_year: int, end_year: int) -> Tuple[bool, str|None]:
     Returns:
         Tuple[bool, str]: A tuple with a boolean indicating validity and an error message if invalid.
     """
-    this_year = int(dt.datetime.strftime(dt.datetime.now(), "%Y"))
+    this_year = THIS_YEAR
     try:
         start_year = int(start_year)
         end_year = int(end_year)
@@ -188,16 +216,42 @@ def read_file(path: str) -> list[dict]:
     Returns:
         list[dict]: A list of dictionaries representing each row in the CSV.
     """
-    with open(path, 'r') as file:
-        lst = []
-        reader = csv.DictReader(file)
-        for row in reader:
-            lst.append(row)
-        return lst
+    with open(path, 'r', newline='') as file:
+        return list(csv.DictReader(file))
     
+def ping_api(count: int) -> None:
+    """
+    Probe connectivity to the BLS API by timing TCP connections to its HTTPS port.
+
+    Special Note:
+        A TCP connect is used instead of ICMP ping, since it measures the same path the
+        API requests take and does not depend on the host answering ICMP.
+
+    Args:
+        count (int): Number of connection probes to send.
+    """
+    for attempt in range(1, count + 1):
+        start = time.perf_counter()
+        try:
+            socket.create_connection((BLS_HOST, 443), timeout=2).close()
+        except OSError as e:
+            print(f"Probe {attempt}: {BLS_HOST}:443 unreachable ({e})")
+            continue
+        print(f"Probe {attempt}: connected to {BLS_HOST}:443 in {(time.perf_counter() - start) * 1000:.2f} ms")
+
 def setup_logging(verbose: bool, output: bool, silence: bool) -> logging.Logger:
     """
     Configure and return a logger for the ETL pipeline.
+
+    Handlers are only attached on the first call, so repeated calls in one process
+    do not duplicate log output.
+
+    Special Note:
+        The logger only holds a QueueHandler. A QueueListener thread owns the file and
+        stdout handlers, so log calls never block on disk or terminal writes. The listener
+        is stopped at exit, which flushes any queued records. Records from
+        the "main" logger and its "main.api" child stop there instead of also
+        propagating to the root logger.
     
     Args:
         verbose (bool): If True, set the logging level to DEBUG.
@@ -208,24 +262,31 @@ def setup_logging(verbose: bool, output: bool, silence: bool) -> logging.Logger:
         logging.Logger: Configured logger instance.
     """
     logger = logging.getLogger("main")
+    if logger.handlers:
+        return logger
 
     if not silence:
-        format = '%(levelname)s - %(asctime)s - %(message)s'
-        formatter = logging.Formatter(format)
-
         if verbose:
             logger.setLevel(logging.DEBUG)
         else:
             logger.setLevel(logging.INFO)
 
+        handlers = []
         if output:
             stream_handler = logging.StreamHandler(stream=sys.stdout)
-            stream_handler.setFormatter(formatter)
-            logger.addHandler(stream_handler)
+            stream_handler.setFormatter(LOG_FORMATTER)
+            handlers.append(stream_handler)
 
         file_handler = logging.FileHandler(filename='outputs/runtime_output/main.log')
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(LOG_FORMATTER)
+        handlers.append(file_handler)
+
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        logger.propagate = False
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
 
     return logger
 
@@ -238,10 +299,12 @@ def main() -> None:
         - Parse command-line arguments.
         - Configure logging.
         - Determine if command-line or interactive input is used.
-        - Validate file path and year parameters.
+        - Validate file path and year parameters given on the command line (interactive
+          input is validated as it is entered).
         - Read the CSV file containing series IDs.
         - Instantiate the BlsApiCall object based on the series type.
-        - Sequentially perform extraction, transformation, and loading.
+        - Sequentially perform extraction, transformation, and loading, closing the
+          BlsApiCall session afterwards.
     
     Raises:
         FileNotFoundError: If the CSV file path is invalid.
@@ -251,11 +314,15 @@ def main() -> None:
     logger = setup_logging(args.verbose, args.output, args.silence)
 
     if args.ping:
-        subprocess.run(args=['ping', '-c', str(args.ping), "https://api.bls.gov/publicAPI/v2/timeseries/data/"], stdout=sys.stdout)
+        ping_api(args.ping)
         sys.exit()
     
     if args.traceroute:
-        subprocess.run(args=['traceroute', "https://api.bls.gov/publicAPI/v2/timeseries/data/"], stdout=sys.stdout)
+        try:
+            subprocess.run(args=['traceroute', BLS_HOST], stdout=sys.stdout, timeout=TRACEROUTE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            logger.warning("Traceroute to %s timed out after %s seconds", BLS_HOST, TRACEROUTE_TIMEOUT)
+            print(f"Traceroute to {BLS_HOST} timed out after {TRACEROUTE_TIMEOUT} seconds.")
         sys.exit()
 
     if (args.start_year or args.end_year or args.series_type or args.path) and not \
@@ -264,30 +331,30 @@ def main() -> None:
         raise ValueError("Please Specify --path, --type, --start-year, and --end-year or nothing for interactive input.")
     
     if args.path and args.series_type and args.start_year and args.end_year:
-        logging.debug("Using command line arguments")
+        logger.debug("Using command line arguments")
         user_input = {
             "path": args.path,
             "series_type": args.series_type,
             "start_year": args.start_year,
             "end_year": args.end_year,
             "series_count": args.series_count or ""}
+
+        path_valid, path_message = validate_path(user_input['path'])
+        years_valid, years_message = validate_years(user_input['start_year'], user_input['end_year'])
+
+        if not path_valid:
+            logger.error(path_message)
+            print(path_message)
+            raise FileNotFoundError(path_message)
+
+        if not years_valid:
+            logger.error(years_message)
+            print(years_message)
+            raise ValueError(years_message)
+        logger.debug("User input valid")
     else:
-        logging.info("Using interactive input")
+        logger.info("Using interactive input")
         user_input = interactive_user_input()
-
-    path_valid, path_message = validate_path(user_input['path'])
-    years_valid, years_message = validate_years(user_input['start_year'], user_input['end_year'])
-    logger.debug("User input valid")
-    
-    if not path_valid:  
-        logger.error(path_message)
-        print(path_message)
-        raise FileNotFoundError(path_message)
-    
-    if not years_valid:
-        logger.error(years_message)
-        print(years_message)
-        raise ValueError(years_message)
     
     try:
         series_input = read_file(user_input['path'])
@@ -307,40 +374,43 @@ def main() -> None:
         print(error_message)
         sys.exit(1)
 
+    from api_bls import BlsApiCall
+
     try:
         if series_type == 1:
-            logging.debug("Processing national series")
-            api_engine = BlsApiCall(start_year, end_year, national_series=series_input, series_count=series_count)
+            logger.debug("Processing national series")
+            api_engine = BlsApiCall(start_year, end_year, national_series=series_input, series_count=series_count, use_cache=not args.no_cache)
         else:
-            logging.debug("Processing state series")
-            api_engine = BlsApiCall(start_year, end_year, state_series=series_input, series_count=series_count)
+            logger.debug("Processing state series")
+            api_engine = BlsApiCall(start_year, end_year, state_series=series_input, series_count=series_count, use_cache=not args.no_cache)
     except BaseException as e:
-        logger.error(f"Error while instantiating BlsApiCall class: {e}")
+        logger.error("Error while instantiating BlsApiCall class: %s", e)
         raise
 
-    try:
-        logger.debug("Extracting data from BLS API")
-        api_engine.extract()
-        logger.debug("Successfully extracted data from BLS API")
-    except BaseException as e:
-        logger.error(f"Error while extracting data: {e}")
-        raise
+    with api_engine:
+        try:
+            logger.debug("Extracting data from BLS API")
+            api_engine.extract()
+            logger.debug("Successfully extracted data from BLS API")
+        except BaseException as e:
+            logger.error("Error while extracting data: %s", e)
+            raise
 
-    try:
-        logger.debug("Transforming and cleaning data")
-        api_engine.transform()
-        logger.debug("Successfully transformed and cleaned data")
-    except BaseException as e:
-        logger.error(f"Error while transforming data: {e}")
-        raise
+        try:
+            logger.debug("Transforming and cleaning data")
+            api_engine.transform()
+            logger.debug("Successfully transformed and cleaned data")
+        except BaseException as e:
+            logger.error("Error while transforming data: %s", e)
+            raise
 
-    try:
-        logger.debug("Loading data into database")
-        api_engine.load()
-        logger.debug("Successfully loaded data into database")
-    except BaseException as e:
-        logger.error(f"Error while loading data: {e}")
-        raise
+        try:
+            logger.debug("Loading data into database")
+            api_engine.load()
+            logger.debug("Successfully loaded data into database")
+        except BaseException as e:
+            logger.error("Error while loading data: %s", e)
+            raise
 
 if __name__ == "__main__":
     main()
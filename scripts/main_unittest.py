@@ -13,7 +13,8 @@
 
         External:
             - csv
-            - datetime
+            - os
+            - subprocess
             - tempfile
             - unittest
             - unittest.mock
@@ -28,19 +29,20 @@
           proper error reporting and graceful exits for common errors.
 =========================================================================================="""
 import csv
-import datetime as dt
+import os
+import subprocess
 import tempfile
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
-from main import main, interactive_user_input, read_file
+from main import main, interactive_user_input, ping_api, read_file, validate_path
 
 class TestMain(unittest.TestCase):
 
     @patch('main.validate_path')
     @patch('main.validate_years')
     @patch('main.read_file')
-    @patch('main.BlsApiCall')
+    @patch('api_bls.BlsApiCall')
     @patch('main.arg_parser')
     def test_all_main_args(self, mocked_parser,mocked_bls, mocked_read, mocked_years, mocked_path):
         """
@@ -48,6 +50,8 @@ class TestMain(unittest.TestCase):
         Verifies that the corresponding functions are called in the correct order.
         """
         args = mocked_parser()
+        args.ping = False
+        args.traceroute = False
         args.path = 'path/to/csv'
         args.series_type = 1
         args.start_year = 2000
@@ -64,7 +68,7 @@ class TestMain(unittest.TestCase):
     @patch('main.validate_path')
     @patch('main.validate_years')
     @patch('main.read_file')
-    @patch('main.BlsApiCall')
+    @patch('api_bls.BlsApiCall')
     @patch('main.arg_parser')
     def test_main_args_missing(self, mocked_parser,mocked_bls, mocked_read, mocked_years, mocked_path):
         """
@@ -72,6 +76,8 @@ class TestMain(unittest.TestCase):
         Verifies that a ValueError is raised and the functions are not called.
         """
         args = mocked_parser()
+        args.ping = False
+        args.traceroute = False
         args.path = 'path/to/csv'
         args.series_type = 1
         args.start_year = 2000
@@ -90,18 +96,21 @@ class TestMain(unittest.TestCase):
     @patch('main.validate_path')
     @patch('main.validate_years')
     @patch('main.read_file')
-    @patch('main.BlsApiCall')
+    @patch('api_bls.BlsApiCall')
     @patch('main.arg_parser')
     def test_run_interactive_user_input(self, mocked_parser,mocked_bls, mocked_read, mocked_years, mocked_path, mocked_user_input):
         """
         Test case for handling interactive user input when no command-line arguments are provided.
-        Verifies that the function processes the input correctly.
+        Verifies that the function processes the input correctly without validating it a second time.
         """
         args = mocked_parser()
+        args.ping = False
+        args.traceroute = False
         args.path = False
         args.series_type = False
         args.start_year = False
         args.end_year = False
+        args.no_cache = False
         mocked_user_input.return_value = {'path':'path/to/csv',
                                         'start_year': 2000,
                                         'end_year':2005,
@@ -112,10 +121,10 @@ class TestMain(unittest.TestCase):
         mocked_path.return_value = True, None
 
         main()
-        mocked_bls.assert_called_once_with(2000, 2005, national_series=mocked_read.return_value, series_count=False)
+        mocked_bls.assert_called_once_with(2000, 2005, national_series=mocked_read.return_value, series_count=False, use_cache=True)
         mocked_read.assert_called_once()
-        mocked_years.assert_called_once()
-        mocked_path.assert_called_once()
+        mocked_years.assert_not_called()
+        mocked_path.assert_not_called()
         mocked_user_input.assert_called_once()
 
     @patch('main.validate_years')
@@ -124,7 +133,8 @@ class TestMain(unittest.TestCase):
     def test_interactive_user_input(self, mocked_input, mocked_path, mocked_years):
         """
         Test case for validating user input during the interactive mode. 
-        Verifies that all expected inputs are captured and validated correctly.
+        Verifies that all expected inputs are captured and validated correctly, and that
+        the prompts are asked in the listed order.
         """
         responses = {"Enter CSV path: ": 'path/to/csv',
                     "Enter 1 for National Series, 2 for State Series: ": "1",
@@ -133,19 +143,22 @@ class TestMain(unittest.TestCase):
                     "Enter desired number of series from input (Press enter for all): ": "50"}
         mocked_path.return_value = True, None
         mocked_years.return_value = True, None
-        mocked_input.side_effect = responses.get
+        mocked_input.side_effect = list(responses.values())
         interactive_user_input()
         mocked_path.assert_called_once()
         mocked_years.assert_called_once()
-        assert mocked_input.call_count == 5
+        self.assertEqual([call.args[0] for call in mocked_input.call_args_list], list(responses))
 
     @patch('main.arg_parser')
     def test_csv_reader(self, mocked_args):
         """
         Test case for reading a CSV file and verifying the data processing.
-        Simulates writing a temporary CSV file and passing it through the read_file function.
+        Simulates writing a CSV file in a per-test scratch directory and passing it through
+        the read_file function, so parallel workers never share the file.
         """
-        fd, path = tempfile.mkstemp(suffix='csv', text=True)
+        scratch_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch_dir.cleanup)
+        path = os.path.join(scratch_dir.name, 'series.csv')
         with open(path, 'w') as file:
             file.write('seriesID,series,state,survey,is_adjusted\n')
             file.write('123ABC,Always be Cool,MI,ABC,False\n')
@@ -155,7 +168,8 @@ class TestMain(unittest.TestCase):
         args.series_type = 1
         args.start_year = 2000
         args.end_year = 2005
-        read_file(args.path, args.series_type)
+        rows = read_file(args.path)
+        self.assertEqual([row['seriesID'] for row in rows], ['123ABC', '124ABC'])
 
     @patch('main.validate_path')
     @patch('main.read_file')
@@ -166,36 +180,20 @@ class TestMain(unittest.TestCase):
         exceptions like permission errors, value errors, and CSV-related errors.
         """
         args = mocked_args()
+        args.ping = False
+        args.traceroute = False
         args.path = 'path/to/csv'
         args.series_type = 1
         args.start_year = 2000
         args.end_year = 2005
         mocked_path.return_value = True, None
 
-        mocked_read.side_effect = PermissionError
-        with self.assertRaises(SystemExit):
-            main()
-
-        mocked_read.side_effect = ValueError
-        with self.assertRaises(SystemExit):
-            main()
-
-        mocked_read.side_effect = csv.Error
-        with self.assertRaises(SystemExit):
-            main()
-
-        mocked_read.side_effect = IOError
-        with self.assertRaises(SystemExit):
-            main()
+        for error in (PermissionError, ValueError, csv.Error, IOError, UnicodeDecodeError, Exception):
+            with self.subTest(error=error.__name__):
+                mocked_read.side_effect = error
+                with self.assertRaises(SystemExit):
+                    main()
 
-        mocked_read.side_effect = UnicodeDecodeError
-        with self.assertRaises(SystemExit):
-            main()
-
-        mocked_read.side_effect = Exception
-        with self.assertRaises(SystemExit):
-            main()
-        
     @patch("main.arg_parser")
     @patch("main.validate_path")
     def test_path_exception(self, mocked_path, mocked_parser):
@@ -203,6 +201,8 @@ class TestMain(unittest.TestCase):
         Test case for handling path validation errors. Simulates a file not found exception.
         """
         args = mocked_parser()
+        args.ping = False
+        args.traceroute = False
         args.path = 'path/to/csv'
         args.series_type = 1
         args.start_year = 2000
@@ -212,49 +212,86 @@ class TestMain(unittest.TestCase):
             main()
         self.assertEqual(str(e.exception), "Path not found.")
 
+    def test_validate_path(self):
+        """
+        Test case for path validation. Verifies that only an existing regular file is
+        accepted, so a directory fails here instead of later when it is read.
+        """
+        scratch_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch_dir.cleanup)
+        path = os.path.join(scratch_dir.name, 'series.csv')
+        with open(path, 'w') as file:
+            file.write('seriesID\n')
+
+        self.assertEqual(validate_path(path), (True, None))
+        self.assertEqual(validate_path(scratch_dir.name), (False, "Path not found or not a file."))
+        self.assertEqual(validate_path(os.path.join(scratch_dir.name, 'missing.csv')), (False, "Path not found or not a file."))
+
+    @patch("main.THIS_YEAR", 2024)
     @patch("main.arg_parser")
     @patch("main.validate_path")
     def test_years_exception(self, mocked_path, mocked_parser):
         """
         Test case for handling year validation errors. Simulates invalid, non-positive, 
         or future year inputs and verifies appropriate error messages.
+        The current year is pinned to 2024 so the assertions do not depend on the clock.
         """
         args = mocked_parser()
+        args.ping = False
+        args.traceroute = False
         args.path = 'path/to/csv'
         args.series_type = 1
-        
-        args.start_year = "two thousand twenty"
-        args.end_year = 2010
         mocked_path.return_value = True, None
-        with self.assertRaises(ValueError) as e:
-            main()
-        print(str(e.exception))
-        self.assertEqual(str(e.exception), "Error: Years must be integers.")
 
-        args.start_year = -2000
-        args.end_year = 2010
-        with self.assertRaises(ValueError) as e:
-            main()
-        self.assertEqual(str(e.exception), "Error: Years must be positive integers.")
+        cases = [("two thousand twenty", 2010, "Error: Years must be integers."),
+                 (-2000, 2010, "Error: Years must be positive integers."),
+                 (2000, 2034, "Error: End year cannot be in the future (current year: 2024)."),
+                 (2010, 200, "Error: Start year must be before end year."),
+                 (2000, 2024, "Error: Year range cannot exceed 20 years due to API limitations.")]
 
-        this_year = int(dt.datetime.strftime(dt.datetime.now(), "%Y"))
-        args.start_year = 2000
-        args.end_year = this_year + 10
-        with self.assertRaises(ValueError) as e:
-            main()
-        self.assertEqual(str(e.exception), f"Error: End year cannot be in the future (current year: {this_year}).")
+        for start_year, end_year, message in cases:
+            with self.subTest(start_year=start_year, end_year=end_year):
+                args.start_year = start_year
+                args.end_year = end_year
+                with self.assertRaises(ValueError) as e:
+                    main()
+                self.assertEqual(str(e.exception), message)
 
-        args.start_year = 2010
-        args.end_year = 200
-        with self.assertRaises(ValueError) as e:
-            main()
-        self.assertEqual(str(e.exception), "Error: Start year must be before end year.")
+    @patch('builtins.print')
+    @patch('main.socket.create_connection')
+    def test_ping_api(self, mocked_connect, mocked_print):
+        """
+        Test case for the TCP connectivity probe. Verifies that one connection is
+        opened and closed per probe, and that a failed probe does not stop the rest.
+        """
+        mocked_connect.side_effect = [Mock(), OSError("timed out"), Mock()]
 
-        args.start_year = 2000
-        args.end_year = 2025
-        with self.assertRaises(ValueError) as e:
+        ping_api(3)
+
+        mocked_connect.assert_called_with(('api.bls.gov', 443), timeout=2)
+        self.assertEqual(mocked_connect.call_count, 3)
+        self.assertEqual(mocked_print.call_count, 3)
+        self.assertIn("unreachable", mocked_print.call_args_list[1].args[0])
+
+    @patch('builtins.print')
+    @patch('main.subprocess.run')
+    @patch('main.arg_parser')
+    def test_traceroute_timeout(self, mocked_parser, mocked_run, mocked_print):
+        """
+        Test case for the traceroute option. Verifies that traceroute targets the API host
+        with a timeout, and that a timeout is reported before the program exits.
+        """
+        args = mocked_parser()
+        args.ping = False
+        args.traceroute = True
+        mocked_run.side_effect = subprocess.TimeoutExpired('traceroute', 60)
+
+        with self.assertRaises(SystemExit):
             main()
-        self.assertEqual(str(e.exception), "Error: Year range cannot exceed 20 years due to API limitations.")
+
+        self.assertEqual(mocked_run.call_args.kwargs['args'], ['traceroute', 'api.bls.gov'])
+        self.assertEqual(mocked_run.call_args.kwargs['timeout'], 60)
+        self.assertIn("timed out", mocked_print.call_args.args[0])
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file